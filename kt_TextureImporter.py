@@ -30,11 +30,31 @@ import hou
 import os
 import re
 import voptoolutils
+from functools import partial
 from PySide2 import QtCore
 from PySide2 import QtWidgets
 from PySide2 import QtGui
 
 #region Texture
+def _buildMappingLookup(textureMapping):
+    """
+    Inverts a texture mapping dictionary so every label, abbreviation and mapping token points to its parent.
+
+    Args:
+        textureMapping (dict): The texture mapping dictionary of a `Texture` class.
+
+    Returns:
+        dict: A dictionary of {attr: {value: parent}} used for constant time lookups.
+    """
+    lookup = {}
+    for parent, children in textureMapping.items():
+        for attr, values in children.items():
+            if isinstance(values, str):
+                values = (values,)
+            for value in values:
+                lookup.setdefault(attr, {})[value] = parent
+    return lookup
+
 class Texture(object):
     """
     A class representing a texture object with various material properties.
@@ -48,7 +68,30 @@ class Texture(object):
         displacement (str, optional): The displacement map texture file value.
         ambientOcclusion (str, optional): The Ambient Occlusion map texture file value. Defaults to None.
         textureMapping (dict): A dictionary mapping texture attributes to their corresponding labels, abbreviations and mappings.
+            Shared by all instances as a class constant, mapping tokens are stored as frozensets.
     """
+    __slots__ = ("name", "baseColor", "metalness", "specularRough", "normal", "displacement", "ambientOcclusion", "transmission", "opacity")
+
+    # Attributes printed by showInformation, subclasses declare empty slots so they are read from here
+    _PRINT_ATTRS = __slots__
+
+    textureMapping = {
+        "baseColor": {"label": "Base Color", "abbreviation": "BC", "mapping": frozenset(("basecolor", "base", "albedo"))},
+        "metalness": {"label": "Metalness", "abbreviation": "M", "mapping": frozenset(("metalness", "metallic"))},
+        "specularRough": {"label": "Specular Rough", "abbreviation": "SR", "mapping": frozenset(("roughness", "specular"))},
+        "normal": {"label": "Normal", "abbreviation": "N", "mapping": frozenset(("normal",))},
+        "displacement": {"label": "Displacement", "abbreviation": "D", "mapping": frozenset(("height", "displacement"))},
+        "ambientOcclusion": {"label": "Ambient Occlusion", "abbreviation": "AO", "mapping": frozenset(("ao","ambientocclusion","ambientoclussion"))},
+        "transmission": {"label": "Transmission", "abbreviation": "T", "mapping": frozenset(("transmission","transmision"))},
+        "opacity": {"label": "Opacity", "abbreviation": "O", "mapping": frozenset(("opacity",))},
+    }
+
+    # Inverted index of textureMapping built once at import: {attr: {value: parent}}
+    _LOOKUP = _buildMappingLookup(textureMapping)
+
+    # Single alternation of every mapping token (longest first, then alphabetical to keep the pattern stable) so a filename token is matched in one pass
+    _MAPPING_REGEX = re.compile("|".join(re.escape(token) for token in sorted(_LOOKUP["mapping"], key=lambda token: (-len(token), token))), re.IGNORECASE)
+
     def __init__(self, name, baseColor=None, metalness=None, specularRough=None, normal=None, displacement=None, ambientOcclusion=None,
                  transmission=None, opacity=None):
         """
@@ -62,9 +105,8 @@ class Texture(object):
             normal (str, optional): The normal map texture file value. Defaults to None.
             displacement (str, optional): The displacement map texture file value. Defaults to None.
             ambientOcclusion (str, optional): The Ambient Occlusion map texture file value. Defaults to None.
-        
-        Attributes:
-            textureMapping (dict): A dictionary mapping texture attributes to their corresponding labels, abbreviations and mappings.
+            transmission (str, optional): The transmission map texture file value. Defaults to None.
+            opacity (str, optional): The opacity map texture file value. Defaults to None.
         """
         self.name = name
         self.baseColor = baseColor
@@ -76,22 +118,97 @@ class Texture(object):
         self.transmission = transmission
         self.opacity = opacity
 
-        self.textureMapping = {
-            "baseColor": {"label": "Base Color", "abbreviation": "BC", "mapping": ["basecolor", "base", "albedo"]},
-            "metalness": {"label": "Metalness", "abbreviation": "M", "mapping": ["metalness", "metallic"]},
-            "specularRough": {"label": "Specular Rough", "abbreviation": "SR", "mapping": ["roughness", "specular"]},
-            "normal": {"label": "Normal", "abbreviation": "N", "mapping": ["normal"]},
-            "displacement": {"label": "Displacement", "abbreviation": "D", "mapping": ["height", "displacement"]},
-            "ambientOcclusion": {"label": "Ambient Occlusion", "abbreviation": "AO", "mapping": ["ao","ambientocclusion","ambientoclussion"]},
-            "transmission": {"label": "Transmission", "abbreviation": "T", "mapping": ["transmission","transmision"]},
-            "opacity": {"label": "Opacity", "abbreviation": "O", "mapping": ["opacity"]},
-        }
+    # Texture attributes wired by createInputs, in creation order. Overridden by every renderer, each entry is
+    # (attribute, image node suffix, extra image parms, image output, intermediate nodes, target, target input)
+    # and every intermediate node is (node type, node suffix, input, output, parms)
+    _INPUT_PLAN = ()
 
-    
     def createTexture(self):
         """Placeholder method for creating a texture object."""
         pass
 
+    def getFullPaths(self, path):
+        """
+        Builds the full file path of every texture attribute at once, joining them to a single precomputed folder prefix.
+
+        Args:
+            path (str): Folder path where the files will be located.
+
+        Returns:
+            dict: A dictionary mapping each texture attribute to its full path, or None if the attribute has no file.
+        """
+        prefix = path if not path or path.endswith(("/", "\\")) else path + os.sep
+        fullPaths = {}
+        for attr in self.textureMapping:
+            textureName = getattr(self, attr)
+            fullPaths[attr] = prefix + textureName if textureName else None
+        return fullPaths
+
+    def getImageNode(self, builderNode, nodeType, name, parms, cache=None):
+        """
+        Returns an image node inside a material builder reading the given file, reusing the cached one
+        when the same file was already requested with the same parameters.
+
+        Args:
+            builderNode (hou.Node): Material builder node where the image node lives.
+            nodeType (str): Node type of the image node.
+            name (str): Name of the image node if it needs to be created.
+            parms (dict): Parameter values of the image node, including its file path.
+            cache (dict, optional): Image nodes already created during the current import. Defaults to None.
+
+        Returns:
+            hou.Node: The image node reading the file.
+        """
+        key = (builderNode.path(), nodeType, tuple(parms.items()))
+        imageNode = cache.get(key) if cache is not None else None
+
+        if imageNode is None:
+            imageNode = builderNode.createNode(nodeType, name)
+            for parmName, value in parms.items():
+                imageNode.parm(parmName).set(value)
+            if cache is not None:
+                cache[key] = imageNode
+
+        return imageNode
+
+    def createInputs(self, builderNode, imageType, fileParm, fullPaths, targets, cache=None):
+        """
+        Creates the image node of every attribute in `_INPUT_PLAN` that has a file, chains its
+        intermediate nodes and connects the last one to its target node.
+
+        Args:
+            builderNode (hou.Node): Material builder node where the nodes are created.
+            imageType (str): Node type of the image nodes.
+            fileParm (str): Parameter of the image nodes holding the file path.
+            fullPaths (dict): Full path of every texture attribute, as returned by getFullPaths.
+            targets (dict): Nodes the plan connects to, keyed by the target name used in `_INPUT_PLAN`.
+            cache (dict, optional): Image nodes already created during the current import. Defaults to None.
+        """
+        name = self.name
+        for attr, suffix, imageParms, output, chain, target, targetInput in self._INPUT_PLAN:
+            fullPath = fullPaths[attr]
+            if not fullPath:
+                continue
+
+            node = self.getImageNode(builderNode, imageType, f"{name}_{suffix}", {fileParm: fullPath, **imageParms}, cache)
+            for nodeType, nodeSuffix, inputName, nodeOutput, parms in chain:
+                chainNode = builderNode.createNode(nodeType, f"{name}_{nodeSuffix}")
+                for parmName, value in parms.items():
+                    chainNode.parm(parmName).set(value)
+                chainNode.setNamedInput(inputName, node, output)
+                node, output = chainNode, nodeOutput
+
+            targets[target].setNamedInput(targetInput, node, output)
+
+    def getSignature(self):
+        """
+        Returns the values that identify this texture, used to recognise the same material between imports.
+
+        Returns:
+            tuple: The name and every texture file value, in `__slots__` order.
+        """
+        return tuple(getattr(self, attr) for attr in Texture.__slots__)
+
     def getTypeFromAttr(self, attr, text):
         """
         Determines the texture type based on a given attribute and text mapping.
@@ -103,18 +220,13 @@ class Texture(object):
         Returns:
             str or None: The parent texture type if found, otherwise None.
         """
-        for parent, children in self.textureMapping.items():
-            if text in children[attr]:
-                return parent
-        return None
+        return self._LOOKUP[attr].get(text)
 
     def showInformation(self):
-        """ Prints all attributes of the texture object except the `textureMapping` dictionary."""
-        print("-----------------------------------------")
-        for attribute, value in vars(self).items():  # Iterate over the instance's attributes
-            if attribute != "textureMapping":  # Exclude textureMapping from being printed
-                print(f"{attribute}: {value}")
-        print("-----------------------------------------")
+        """ Prints all attributes of the texture object."""
+        separator = "-----------------------------------------"
+        lines = [f"{attribute}: {getattr(self, attribute)}" for attribute in self._PRINT_ATTRS]
+        print("\n".join([separator, *lines, separator]))  # A single write instead of one per attribute
 
 class ArnoldTexture(Texture):
     """
@@ -124,6 +236,21 @@ class ArnoldTexture(Texture):
     Attributes:
         Inherits all attributes from the `Texture` class.
     """
+    __slots__ = ()
+
+    # Node type used for every texture file read inside the material builder
+    _IMAGE_TYPE = "arnold::image"
+
+    # Base color is wired by createTexture itself, it is multiplied by the ambient occlusion when there is one
+    _INPUT_PLAN = (
+        ("metalness", "M", {}, "r", (), "surface", "metalness"),
+        ("specularRough", "SR", {}, "r", (), "surface", "specular_roughness"),
+        ("normal", "N", {}, "rgba", (("arnold::normal_map", "NM", "input", "vector", {}),), "surface", "normal"),
+        ("displacement", "D", {}, "r", (("arnold::range", "RNG", "input", "r", {"output_max": 0.001}),), "output", "displacement"),
+        ("transmission", "T", {}, "rgba", (), "surface", "transmission_color"), #TODO MODIFY the value transmission to 1
+        ("opacity", "O", {}, "rgba", (), "surface", "opacity"),
+    )
+
     def __init__(self, name="ArnoldTexture", baseColor=None, metalness=None, specularRough=None, normal=None, displacement=None, ambientOcclusion=None,
                  transmission=None, opacity=None):
         """Initializes a ArnoldTexture with various material properties
@@ -133,91 +260,62 @@ class ArnoldTexture(Texture):
             baseColor (str, optional): The baseColor texture file value. Defaults to None.
             metalness (str, optional): The metalness texture file value. Defaults to None.
             specularRough (str, optional): The specularRough texture file value. Defaults to None.
-            normal (str, optional): The displacement texture file value. Defaults to None.
-            displacement (str, optional): The base color texture file value. Defaults to None.
+            normal (str, optional): The normal texture file value. Defaults to None.
+            displacement (str, optional): The displacement texture file value. Defaults to None.
+            ambientOcclusion (str, optional): The ambient occlusion texture file value. Defaults to None.
+            transmission (str, optional): The transmission texture file value. Defaults to None.
+            opacity (str, optional): The opacity texture file value. Defaults to None.
         """
         super().__init__(name=name, baseColor=baseColor, metalness=metalness, specularRough=specularRough, normal=normal, displacement=displacement, ambientOcclusion=ambientOcclusion,
                          transmission=transmission, opacity=opacity)
     
-    def createTexture(self, parentNode, path, imageFormat):
+    def createTexture(self, parentNode, path, imageFormat, cache=None):
         """Creates an Arnold Material Builder node connecting Arnold shader nodes for various texture attributes.
 
         Args:
             parentNode (obj): Parent node where all nodes will be created an connected
             path (str): Folder path where the files will be located
+            imageFormat (str): Image format selected by the user
+            cache (dict, optional): Image nodes already created during the current import, shared to avoid duplicates. Defaults to None.
 
         Returns:
             obj: Returns material node created with everything connected
         """
-        # Create the Arnold Material Builder node
-        materialBuilderNode = parentNode.createNode("arnold_materialbuilder", self.name)
-        outMaterialNode = materialBuilderNode.node("OUT_material")
-        standardSurfaceNode = materialBuilderNode.createNode("arnold::standard_surface", f"{self.name}_SDR")
+        name, baseColor, ambientOcclusion = self.name, self.baseColor, self.ambientOcclusion
+        with hou.undos.group(f"Create {name}"):
+            # Create the Arnold Material Builder node
+            materialBuilderNode = parentNode.createNode("arnold_materialbuilder", name)
+            outMaterialNode = materialBuilderNode.node("OUT_material")
+            standardSurfaceNode = materialBuilderNode.createNode("arnold::standard_surface", f"{name}_SDR")
         
-        outMaterialNode.setNamedInput("surface", standardSurfaceNode, "shader")
-        
-        def getFullPath(textureName, path):
-            return os.path.join(path, textureName) if textureName else None
-        
-        # Add the various texture nodes and connect them to the material
-        if self.baseColor:
-            baseColorNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_BC")
-            baseColorNode.parm("filename").set(getFullPath(self.baseColor, path))
-            colorCorrectNode = materialBuilderNode.createNode("arnold::color_correct", f"{self.name}_CC") 
-
-            if self.ambientOcclusion:
-                ambientOcclusionNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_AO")
-                ambientOcclusionNode.parm("filename").set(getFullPath(self.ambientOcclusion, path))
-                multiplyNode = materialBuilderNode.createNode("arnold::multiply", f"{self.name}_Multi")
-                multiplyNode.setNamedInput("input1", baseColorNode, "rgba")
-                multiplyNode.setNamedInput("input2", ambientOcclusionNode, "rgba")
-
-                colorCorrectNode.setNamedInput("input", multiplyNode, "rgb")
-            else:
-                colorCorrectNode.setNamedInput("input", baseColorNode, "rgba")
-
-            standardSurfaceNode.setNamedInput("base_color", colorCorrectNode, "rgba")  
- 
-        if self.metalness:
-            metalnessNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_M")
-            metalnessNode.parm("filename").set(getFullPath(self.metalness, path))
-            standardSurfaceNode.setNamedInput("metalness", metalnessNode, "r")
-
-        if self.specularRough:
-            specularRoughNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_SR")
-            specularRoughNode.parm("filename").set(getFullPath(self.specularRough, path))
-            standardSurfaceNode.setNamedInput("specular_roughness", specularRoughNode, "r")
-
-        if self.normal:
-            normalNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_N")
-            normalNode.parm("filename").set(getFullPath(self.normal, path))
-
-            normalMapNode = materialBuilderNode.createNode("arnold::normal_map", f"{self.name}_NM") 
-            normalMapNode.setNamedInput("input", normalNode, "rgba")
-            standardSurfaceNode.setNamedInput("normal", normalMapNode, "vector")
-
-        if self.displacement:
-            displacementNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_D")
-            displacementNode.parm("filename").set(getFullPath(self.displacement, path))
-
-            rangeNode = materialBuilderNode.createNode("arnold::range", f"{self.name}_RNG")
-            rangeNode.parm("output_max").set(0.001) 
-            rangeNode.setNamedInput("input", displacementNode, "r")
-            outMaterialNode.setNamedInput("displacement", rangeNode, "r")
+            outMaterialNode.setNamedInput("surface", standardSurfaceNode, "shader")
         
-        if self.transmission:
-            transmissionNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_T")
-            standardSurfaceNode.setNamedInput("transmission_color", transmissionNode, "rgba")
-            #TODO MODIFY the value transmission to 1
+            fullPaths = self.getFullPaths(path)
+            imageType = self._IMAGE_TYPE
 
-        if self.opacity:
-            opacityNode = materialBuilderNode.createNode("arnold::image", f"{self.name}_O")
-            standardSurfaceNode.setNamedInput("opacity", opacityNode, "rgba")
+            # Add the various texture nodes and connect them to the material
+            if baseColor:
+                baseColorNode = self.getImageNode(materialBuilderNode, imageType, f"{name}_BC", {"filename": fullPaths["baseColor"]}, cache)
+                colorCorrectNode = materialBuilderNode.createNode("arnold::color_correct", f"{name}_CC") 
 
-        # Organize layout
-        materialBuilderNode.layoutChildren()
+                if ambientOcclusion:
+                    ambientOcclusionNode = self.getImageNode(materialBuilderNode, imageType, f"{name}_AO", {"filename": fullPaths["ambientOcclusion"]}, cache)
+                    multiplyNode = materialBuilderNode.createNode("arnold::multiply", f"{name}_Multi")
+                    multiplyNode.setNamedInput("input1", baseColorNode, "rgba")
+                    multiplyNode.setNamedInput("input2", ambientOcclusionNode, "rgba")
 
-        return materialBuilderNode
+                    colorCorrectNode.setNamedInput("input", multiplyNode, "rgb")
+                else:
+                    colorCorrectNode.setNamedInput("input", baseColorNode, "rgba")
+
+                standardSurfaceNode.setNamedInput("base_color", colorCorrectNode, "rgba")  
+
+            self.createInputs(materialBuilderNode, imageType, "filename", fullPaths, {"surface": standardSurfaceNode, "output": outMaterialNode}, cache)
+
+            # Organize layout
+            materialBuilderNode.layoutChildren()
+
+            return materialBuilderNode
 
 class KarmaTexture(Texture):
     """
@@ -227,6 +325,19 @@ class KarmaTexture(Texture):
     Attributes:
         Inherits all attributes from the `Texture` class.
     """
+    __slots__ = ()
+
+    # Node type used for every texture file read inside the material builder, by image format
+    _IMAGE_TYPES = {"Image 2D": "mtlximage", "Image Tile": "mtlxtiledimage"}
+
+    # Base color is wired by createTexture itself, it is multiplied by the ambient occlusion when there is one
+    _INPUT_PLAN = (
+        ("metalness", "M", {"signature": "default"}, "out", (), "surface", "metalness"),
+        ("specularRough", "SR", {"signature": "default"}, "out", (), "surface", "specular_roughness"),
+        ("normal", "N", {"signature": "vector3"}, "out", (("mtlxnormalmap", "NM", "in", "out", {}),), "surface", "normal"),
+        ("displacement", "D", {"signature": "default"}, "out", (), "displacement", "displacement"),
+    )
+
     def __init__(self, name="KarmaTexture", baseColor=None, metalness=None, specularRough=None, normal=None, displacement=None, ambientOcclusion=None,
                  transmission=None, opacity=None):
         """Initializes a KarmaTexture with various material properties
@@ -236,97 +347,181 @@ class KarmaTexture(Texture):
             baseColor (str, optional): The baseColor texture file value. Defaults to None.
             metalness (str, optional): The metalness texture file value. Defaults to None.
             specularRough (str, optional): The specularRough texture file value. Defaults to None.
-            normal (str, optional): The displacement texture file value. Defaults to None.
-            displacement (str, optional): The base color texture file value. Defaults to None.
+            normal (str, optional): The normal texture file value. Defaults to None.
+            displacement (str, optional): The displacement texture file value. Defaults to None.
             ambientOcclusion (str, optional): The ambient occlusion texture file value. Defaults to None.
+            transmission (str, optional): The transmission texture file value. Defaults to None.
+            opacity (str, optional): The opacity texture file value. Defaults to None.
         """
         super().__init__(name=name, baseColor=baseColor, metalness=metalness, specularRough=specularRough, normal=normal, displacement=displacement, ambientOcclusion=ambientOcclusion,
                          transmission=transmission, opacity=opacity)
 
 
-    def createTexture(self, parentNode, path, imageFormat):
+    def createTexture(self, parentNode, path, imageFormat, cache=None):
         """Creates an Karma Material Builder node connecting MaterialX shader nodes for various texture attributes.
 
         Args:
             parentNode (obj): Parent node where all nodes will be created an connected
             path (str): Folder path where the files will be located
+            imageFormat (str): Image format selected by the user
+            cache (dict, optional): Image nodes already created during the current import, shared to avoid duplicates. Defaults to None.
 
         Returns:
             obj: Returns material node created with everything connected
         """
-        # Create the Arnold Material Builder node
-        mask = voptoolutils.KARMAMTLX_TAB_MASK #voptoolutils._setupMtlXBuilderSubnet(subnet_node=subnet_node, destination_node=dst_node, name=name, mask=mask, folder_label=folder_label, render_context=render_context)
+        name, baseColor, ambientOcclusion = self.name, self.baseColor, self.ambientOcclusion
+        with hou.undos.group(f"Create {name}"):
+            # Create the Arnold Material Builder node
+            mask = voptoolutils.KARMAMTLX_TAB_MASK #voptoolutils._setupMtlXBuilderSubnet(subnet_node=subnet_node, destination_node=dst_node, name=name, mask=mask, folder_label=folder_label, render_context=render_context)
 
-        materialBuilderNode = parentNode.createNode("subnet", self.name)
-        voptoolutils._setupMtlXBuilderSubnet(materialBuilderNode, "karmamaterial", "karmamaterial", mask, "Karma Material Builder", "kma")
+            materialBuilderNode = parentNode.createNode("subnet", name)
+            voptoolutils._setupMtlXBuilderSubnet(materialBuilderNode, "karmamaterial", "karmamaterial", mask, "Karma Material Builder", "kma")
 
-        standardSurfaceNode = materialBuilderNode.node("mtlxstandard_surface")
+            standardSurfaceNode = materialBuilderNode.node("mtlxstandard_surface")
 
-        outMaterialNode = materialBuilderNode.node("Material_Outputs_and_AOVs")
-        outDisplacement = materialBuilderNode.node("mtlxdisplacement") 
+            outMaterialNode = materialBuilderNode.node("Material_Outputs_and_AOVs")
+            outDisplacement = materialBuilderNode.node("mtlxdisplacement") 
 
-        if imageFormat == "Image Tile":
-            imageType = "mtlxtiledimage"
-        else:
-            imageType = "mtlximage"
+            imageType = self._IMAGE_TYPES.get(imageFormat, "mtlximage")
+            fullPaths = self.getFullPaths(path)
 
+            # Add the various texture nodes and connect them to the material
+            if baseColor:
+                baseColorNode = self.getImageNode(materialBuilderNode, imageType, f"{name}_BC", {"file": fullPaths["baseColor"], "signature": "color3"}, cache)
 
-        def getFullPath(textureName, path):
-            return os.path.join(path, textureName) if textureName else None
-        
-        # Add the various texture nodes and connect them to the material
-        if self.baseColor:
-            baseColorNode = materialBuilderNode.createNode(imageType, f"{self.name}_BC")
-            baseColorNode.parm("file").set(getFullPath(self.baseColor, path))
-            baseColorNode.parm("signature").set("color3")
-
-            if self.ambientOcclusion:
-                ambientOcclusionNode = materialBuilderNode.createNode(imageType, f"{self.name}_AO")
-                ambientOcclusionNode.parm("file").set(getFullPath(self.ambientOcclusion, path))
-                ambientOcclusionNode.parm("signature").set("default")
-                multiplyNode = materialBuilderNode.createNode("mtlxmultiply", f"{self.name}_Multi")
-                multiplyNode.setNamedInput("in1", baseColorNode, "out")
-                multiplyNode.setNamedInput("in2", ambientOcclusionNode, "out")
-
-                standardSurfaceNode.setNamedInput("base_color", multiplyNode, "out")
-            else:
-                standardSurfaceNode.setNamedInput("base_color", baseColorNode, "out")
- 
-        if self.metalness:
-            metalnessNode = materialBuilderNode.createNode(imageType, f"{self.name}_M")
-            metalnessNode.parm("file").set(getFullPath(self.metalness, path))
-            metalnessNode.parm("signature").set("default")
-            standardSurfaceNode.setNamedInput("metalness", metalnessNode, "out")
-
-        if self.specularRough:
-            specularRoughNode = materialBuilderNode.createNode(imageType, f"{self.name}_SR")
-            specularRoughNode.parm("file").set(getFullPath(self.specularRough, path))
-            specularRoughNode.parm("signature").set("default")
-            standardSurfaceNode.setNamedInput("specular_roughness", specularRoughNode, "out")
-
-        if self.normal:
-            normalNode = materialBuilderNode.createNode(imageType, f"{self.name}_N")
-            normalNode.parm("file").set(getFullPath(self.normal, path))
-            normalNode.parm("signature").set("vector3")
-
-            normalMapNode = materialBuilderNode.createNode("mtlxnormalmap", f"{self.name}_NM") 
-            normalMapNode.setNamedInput("in", normalNode, "out")
-            standardSurfaceNode.setNamedInput("normal", normalMapNode, "out")
-
-        if self.displacement:
-            displacementNode = materialBuilderNode.createNode(imageType, f"{self.name}_D")
-            displacementNode.parm("file").set(getFullPath(self.displacement, path))
-            displacementNode.parm("signature").set("default")
-            outDisplacement.setNamedInput("displacement", displacementNode, "out")
-
-        # Organize layout
-        materialBuilderNode.layoutChildren()
-
-        return materialBuilderNode
+                if ambientOcclusion:
+                    ambientOcclusionNode = self.getImageNode(materialBuilderNode, imageType, f"{name}_AO", {"file": fullPaths["ambientOcclusion"], "signature": "default"}, cache)
+                    multiplyNode = materialBuilderNode.createNode("mtlxmultiply", f"{name}_Multi")
+                    multiplyNode.setNamedInput("in1", baseColorNode, "out")
+                    multiplyNode.setNamedInput("in2", ambientOcclusionNode, "out")
+
+                    standardSurfaceNode.setNamedInput("base_color", multiplyNode, "out")
+                else:
+                    standardSurfaceNode.setNamedInput("base_color", baseColorNode, "out")
+
+            self.createInputs(materialBuilderNode, imageType, "file", fullPaths, {"surface": standardSurfaceNode, "displacement": outDisplacement}, cache)
+
+            # Organize layout
+            materialBuilderNode.layoutChildren()
+
+            return materialBuilderNode
+
+# Texture class of every renderer listed in the importer, keyed by the renderer name
+_TEXTURE_CLASSES = {"Arnold": ArnoldTexture, "Karma": KarmaTexture}
+
+# File extensions read as textures when scanning a folder, lowercase as filenames are compared ignoring case
+_TEXTURE_EXTENSIONS = (".exr", ".png", ".jpg")
+
+# Sub folders never scanned for textures, hidden folders (starting with ".") are skipped as well
+_SKIPPED_FOLDERS = frozenset(("__pycache__", "thumbnails", "$RECYCLE.BIN", "System Volume Information"))
 
 #endregion
 
 #region Widget
+# Houdini icons shared by every widget, each one loaded once by getHoudiniIcon
+_ICONS = {}
+
+def getHoudiniIcon(name):
+    """
+    Returns a Houdini icon, loading it only the first time any widget asks for it.
+
+    Args:
+        name (str): The Houdini icon name, see https://houdini-icons.dev/
+
+    Returns:
+        QIcon: The shared icon.
+    """
+    icon = _ICONS.get(name)
+    if icon is None:
+        icon = _ICONS[name] = hou.qt.Icon(name)
+    return icon
+
+# Stylesheet of every ktTextureWidget, applied once on the container holding them so Qt only parses it a single time
+_TEXTURE_WIDGET_STYLE = """
+    QGroupBox#headerGB { background-color: #4D4D4D; border: 0px solid #4D4D4D; border-radius: 0px; }
+    QGroupBox#headerGB::title { color: white; }
+    QGroupBox#informationGB { background-color: #363636; border: 0px solid #363636; border-radius: 0px; padding: 0; margin: 0; }
+    QGroupBox#informationGB::title { color: white; }
+    QPushButton#visibilityBTN:flat { color: white; font-size: 16px; border: 0px solid black; border-radius: 0px; padding: 10px 20px; }
+"""
+
+class ktTextureSummaryWidget(QtWidgets.QWidget):
+    # Size in pixels of the indicator painted under every abbreviation
+    _INDICATOR_SIZE = 12
+
+    def __init__(self, labels):
+        """
+        Paints the texture summary in a single widget, an abbreviation per texture attribute
+        with an indicator below it that is filled when the attribute has a file.
+
+        Args:
+            labels (list): The abbreviation of every texture attribute, in display order.
+        """
+        super(ktTextureSummaryWidget, self).__init__()
+        self.labels = labels
+        self.flags = 0  # Bit i is set when the attribute of labels[i] has a file
+
+        font = self.font()
+        font.setPixelSize(14)
+        self.setFont(font)
+        self.setFixedHeight(36)
+        self.setMinimumWidth(28 * len(labels))
+
+    def isFlagSet(self, index):
+        """
+        Args:
+            index (int): The position of the texture attribute in labels.
+
+        Returns:
+            bool: True if the attribute is marked as having a file.
+        """
+        return bool(self.flags & (1 << index))
+
+    def setFlag(self, index, on):
+        """
+        Marks a texture attribute as having a file or not, repainting only if it changed.
+
+        Args:
+            index (int): The position of the texture attribute in labels.
+            on (bool): True if the attribute has a file.
+        """
+        flags = self.flags | (1 << index) if on else self.flags & ~(1 << index)
+        self.setFlags(flags)
+
+    def setFlags(self, flags):
+        """
+        Sets the state of every texture attribute at once, repainting only if it changed.
+
+        Args:
+            flags (int): Bit mask where bit i is set when the attribute of labels[i] has a file.
+        """
+        if flags != self.flags:
+            self.flags = flags
+            self.update()
+
+    def paintEvent(self, event):
+        """Paints every abbreviation centered in its column with its indicator below."""
+        if not self.labels:
+            return
+
+        painter = QtGui.QPainter(self)
+        palette = self.palette()
+        textColor = palette.color(QtGui.QPalette.WindowText)
+        size = self._INDICATOR_SIZE
+        columnWidth = self.width() / len(self.labels)
+        textHeight = self.height() - size - 4
+
+        for index, label in enumerate(self.labels):
+            left = int(index * columnWidth)
+            painter.setPen(textColor)
+            painter.drawText(QtCore.QRect(left, 0, int(columnWidth), textHeight), int(QtCore.Qt.AlignCenter), label)
+
+            indicator = QtCore.QRect(int(left + (columnWidth - size) / 2), textHeight + 2, size, size)
+            if self.flags & (1 << index):
+                painter.fillRect(indicator, palette.color(QtGui.QPalette.Highlight))
+            painter.drawRect(indicator)
+        painter.end()
+
 class ktTextureRowWidget(QtWidgets.QWidget):
     def __init__(self, label, fileType=hou.fileType.Image, mainPath=None):
         """Creates a horizontal widget that contains a label, text field and button.
@@ -345,20 +540,18 @@ class ktTextureRowWidget(QtWidgets.QWidget):
 
     def initUI(self):
         """Set up the layout, label, text field and button."""
-        layout = QtWidgets.QHBoxLayout(self)
+        # Built without a parent and installed once every widget is in it
+        layout = QtWidgets.QHBoxLayout()
 
         lbl = QtWidgets.QLabel(self.label)
         self.txt = QtWidgets.QLineEdit()
-        self.btn = hou.qt.FileChooserButton()
-        self.btn.setFileChooserTitle(f"Please select a {self.label} file")
-        self.btn.setFileChooserMode(hou.fileChooserMode.Read)
-        self.btn.setFileChooserFilter(self.fileType)
-
-        if self.mainPath:
-            self.btn.setFileChooserStartDirectory(self.mainPath)
+        # A plain tool button, the Houdini file chooser is only opened when it is clicked
+        self.btn = QtWidgets.QToolButton()
+        self.btn.setIcon(getHoudiniIcon("BUTTONS_chooser_file"))
+        self.btn.setToolTip(f"Please select a {self.label} file")
 
-        # Connect the button's signal to update the text field
-        self.btn.fileSelected.connect(self.onFileSelected_btn)
+        # Connect the button's signal to open the file chooser
+        self.btn.clicked.connect(self.onClick_btn)
 
         # Add widgets to the layout
         layout.addWidget(lbl)
@@ -370,6 +563,14 @@ class ktTextureRowWidget(QtWidgets.QWidget):
 
         self.setLayout(layout)
 
+    @QtCore.Slot()
+    def onClick_btn(self):
+        """Opens the Houdini file chooser and updates the text field with the selected file."""
+        path = hou.ui.selectFile(start_directory=self.mainPath, title=f"Please select a {self.label} file",
+                                 file_type=self.fileType, chooser_mode=hou.fileChooserMode.Read)
+        if path:
+            self.onFileSelected_btn(path)
+
     def onFileSelected_btn(self, path):
         """Update the text field when a file is selected but only the relativePath.
 
@@ -396,12 +597,16 @@ class ktTextureWidget(QtWidgets.QWidget):
         mainPath (str): The main directory path where texture files are stored.
         selectedCB (QCheckBox): Checkbox for selecting the texture.
         nameTXT (QLineEdit): Text input for the texture's name.
-        summaryLayouts (list): List of dynamically created layouts for texture attributes.
-        textureRows (list): List of dynamically created texture row widgets.
+        summary (ktTextureSummaryWidget): Painted summary of which texture attributes have a file.
+        textureAttrs (list): Texture attribute shown by each summary column, in the same order.
+        textureRows (list): List of texture row widgets, only built the first time the widget is expanded.
         visibilityBTN (QPushButton): Button for toggling visibility of detailed texture inputs.
         headerLYT (QHBoxLayout): Layout for the header section.
         informationLYT (QVBoxLayout): Layout for detailed texture inputs.
     """
+    # Delay in milliseconds used to debounce texture row edits before updating the texture
+    _UPDATE_DELAY = 150
+
     def __init__(self, texture=None, mainPath=None):
         """
         Initializes the ktTextureWidget with a given texture and path.
@@ -415,6 +620,8 @@ class ktTextureWidget(QtWidgets.QWidget):
         self.visibility = False
         self.texture = texture
         self.mainPath = mainPath
+        self._rowsBuilt = False
+        self._pendingTimers = {}  # Debounce timer of every texture row, keyed by row
         
 
         self.createWidgets()
@@ -423,65 +630,37 @@ class ktTextureWidget(QtWidgets.QWidget):
         self.loadInformation()
 
 
-    def _createSummaryRow(self,label):
-        """
-        Creates a row with a QLabel and a QCheckBox for summarizing texture properties.
-
-        Args:
-            label (str): The text label for the row.
-
-        Returns:
-            tuple: A layout containing the label and the checkbox widget itself.
-        """
-        layout = QtWidgets.QVBoxLayout()
-        lbl = QtWidgets.QLabel(label)
-        lbl.setFixedHeight(15)
-        lbl.setStyleSheet("font-size: 14px;")
-        cb = QtWidgets.QCheckBox()
-        cb.setEnabled(False)
-        layout.addWidget(lbl)
-        layout.addWidget(cb)
-
-        layout.setSpacing(1) 
-        layout.setContentsMargins(0, 0, 0, 0)
-        return layout, cb
-
     def createWidgets(self):
         """
         Creates UI widgets for the texture properties.
 
         Initializes checkboxes, text fields, visibility buttons, and dynamically generates
-        texture-related rows based on the texture object.
+        the texture summary based on the texture object. The texture rows are hidden by default,
+        so they are built later by `_buildTextureRows`.
         """
         self.selectedCB = QtWidgets.QCheckBox()
         self.nameTXT = QtWidgets.QLineEdit()
 
-        # Storage for checkbox layouts
-        self.summaryLayouts = []
+        # Storage for the summarized attributes
+        self.textureAttrs = []
         self.textureRows = []
 
+        abbreviations = []
         for attr, details in self.texture.textureMapping.items():
             if hasattr(self.texture, attr):  # Only create if the attribute exists
-                sumLayout, checkbox = self._createSummaryRow(details["abbreviation"])
-                self.summaryLayouts.append((sumLayout, checkbox))
-                
-                rowWidget = ktTextureRowWidget(label=details["label"], mainPath=self.mainPath)
-                self.textureRows.append(rowWidget)
+                abbreviations.append(details["abbreviation"])
+                self.textureAttrs.append(attr)
+        self.summary = ktTextureSummaryWidget(abbreviations)
 
         self.visibilityBTN = QtWidgets.QPushButton() 
+        self.visibilityBTN.setObjectName("visibilityBTN")
         #https://houdini-icons.dev/
-        self.iconCollapsed = hou.qt.Icon("KEYS_Right")   # Left arrow when collapsed hicon:/SVGIcons.index?KEYS_Right.svg
-        self.iconExpanded =  hou.qt.Icon("KEYS_Down")    # Down arrow when expanded hicon:/SVGIcons.index?KEYS_Down.svg
+        self.iconCollapsed = getHoudiniIcon("KEYS_Right")   # Left arrow when collapsed hicon:/SVGIcons.index?KEYS_Right.svg
+        self.iconExpanded = getHoudiniIcon("KEYS_Down")     # Down arrow when expanded hicon:/SVGIcons.index?KEYS_Down.svg
         self.visibilityBTN.setIcon(self.iconCollapsed)  # Default icon
         self.visibilityBTN.setFlat(True)
         self.visibilityBTN.setFixedWidth(30)
 
-        # Set the button's style using setStyleSheet
-        self.visibilityBTN.setStyleSheet("""
-            QPushButton:flat {color: white; font-size: 16px; border: 0px solid black; border-radius: 0px; padding: 10px 20px;
-            }
-        """)
-
     def createLayouts(self):
         """
         Organizes and arranges UI elements into structured layouts.
@@ -493,43 +672,31 @@ class ktTextureWidget(QtWidgets.QWidget):
         self.mainLayout.setContentsMargins(0, 0, 0, 0)
         self.mainLayout.setSpacing(0)
 
-        self.headerLYT = QtWidgets.QHBoxLayout(self)
+        self.headerLYT = QtWidgets.QHBoxLayout()
         self.headerLYT.setContentsMargins(0, 0, 0, 0)
         self.headerGB = QtWidgets.QGroupBox("")
+        self.headerGB.setObjectName("headerGB")  # Styled by _TEXTURE_WIDGET_STYLE
         self.headerGB.setLayout(self.headerLYT)
         self.headerGB.setFixedHeight(60)
-        self.headerGB.setStyleSheet("""
-            QGroupBox {background-color: #4D4D4D; border: 0px solid #4D4D4D; border-radius: 0px; }
-            QGroupBox::title { color: white; }
-        """)
 
         # Add Checkboxes
         self.headerLYT.addWidget(self.selectedCB)
         self.headerLYT.addWidget(self.nameTXT)
 
-        # Dynamically add summary rows to the header layout
-        for layout, checkbox in self.summaryLayouts:
-            self.headerLYT.addLayout(layout)
-                
+        # Summary of every texture attribute, painted by a single widget
+        self.headerLYT.addWidget(self.summary)
         
         self.headerLYT.addWidget(self.visibilityBTN) 
 
         """Information Layout"""
-        self.informationLYT = QtWidgets.QVBoxLayout(self) 
+        self.informationLYT = QtWidgets.QVBoxLayout()
         self.informationLYT.setContentsMargins(0, 5, 0, 5)  # Remove all margins (left, top, right, bottom)
 
         self.informationGB = QtWidgets.QGroupBox("")
+        self.informationGB.setObjectName("informationGB")  # Styled by _TEXTURE_WIDGET_STYLE
         self.informationGB.setLayout(self.informationLYT)
         self.informationGB.setVisible(self.visibility)
-        self.informationGB.setStyleSheet("""
-            QGroupBox { background-color: #363636; border: 0px solid #363636; border-radius: 0px; padding: 0; margin: 0; }
-            QGroupBox::title { color: white; }
-        """)
-        
-        # Add texture input widgets dynamically
-        for row in self.textureRows:
-            if row:
-                self.informationLYT.addWidget(row)
+        # Texture input widgets are added by _buildTextureRows when the widget is first expanded
 
 
         #self.mainLayout.addLayout(self.headerLYT)
@@ -541,58 +708,126 @@ class ktTextureWidget(QtWidgets.QWidget):
         Establishes connections between UI elements and their respective functions.
 
         Connects signals such as textChanged and button clicks to methods that handle
-        updating texture properties and toggling visibility.
+        updating texture properties and toggling visibility. Texture rows are connected
+        by `_buildTextureRows` once they exist.
         """
-        self.nameTXT.textChanged.connect(lambda text: self.updateInformation('name', text, None))
-
-        # Dynamically connect each texture row's textChanged signal
-        for row, (sumLayout, checkbox) in zip(self.textureRows, self.summaryLayouts):
-            row.txt.textChanged.connect(lambda text, row=row, checkbox=checkbox: self.updateInformation(row.label, text, checkbox))
+        self.nameTXT.textChanged.connect(partial(self.updateInformation, 'name', summaryIndex=None))
 
         # Connect visibility button to toggle texture row visibility
         self.visibilityBTN.clicked.connect(self.toggleVisibility)
 
+    def _buildTextureRows(self):
+        """
+        Builds, fills and connects the texture row widgets the first time the widget is expanded.
+
+        Texture row edits are debounced so the texture is updated once the user stops typing
+        instead of on every keystroke.
+        """
+        for summaryIndex, attr in enumerate(self.textureAttrs):
+            row = ktTextureRowWidget(label=self.texture.textureMapping[attr]["label"], mainPath=self.mainPath)
+            row.txt.setText(getattr(self.texture, attr) or "")  # Filled before connecting, the texture already has this value
+            self.informationLYT.addWidget(row)
+            self.textureRows.append(row)
+
+            timer = QtCore.QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self._UPDATE_DELAY)
+            timer.timeout.connect(partial(self._commitRow, row, summaryIndex))
+            self._pendingTimers[row] = timer
+
+            # Restart the timer on every keystroke (a C++ slot, no Python runs while typing), commit straight away when the edit is finished
+            row.txt.textChanged.connect(timer.start)
+            row.txt.editingFinished.connect(partial(self._commitRow, row, summaryIndex))
+
+        self._rowsBuilt = True
+
+    @QtCore.Slot()
     def toggleVisibility(self):
         """Toggle the visibility of the texture rows using the visibility flag."""
         self.visibility = not self.visibility
+        if self.visibility and not self._rowsBuilt:
+            self._buildTextureRows()
         self.informationGB.setVisible(self.visibility)
         self.visibilityBTN.setIcon(self.iconExpanded if self.visibility else self.iconCollapsed)
 
-    def updateInformation(self, textureProperty, text, checkbox):
+    def _commitRow(self, row, summaryIndex):
+        """
+        Cancels the pending debounce of a texture row and updates the texture with its current text.
+
+        Args:
+            row (ktTextureRowWidget): The texture row that was edited.
+            summaryIndex (int): The summary column linked to this row.
+        """
+        self._pendingTimers[row].stop()
+        self.updateInformation(row.label, row.txt.text(), summaryIndex)
+
+    def updateInformation(self, textureProperty, text, summaryIndex):
         """
         Updates the texture object based on user input.
 
         Args:
             textureProperty (str): The texture property being modified.
             text (str): The new value entered by the user.
-            checkbox (QCheckBox, optional): The checkbox linked to this property, updated accordingly.
+            summaryIndex (int, optional): The summary column linked to this property, updated accordingly.
         """
         if textureProperty == 'name':
             textureType = 'name'
         else:
             textureType = self.texture.getTypeFromAttr("label", textureProperty)
-        setattr(self.texture, str(textureType), text.strip())  # Update the corresponding texture property
+        value = text.strip()
+        if getattr(self.texture, str(textureType)) == value:
+            return  # Nothing changed, the texture and its summary are already up to date
+        setattr(self.texture, str(textureType), value)  # Update the corresponding texture property
 
-        if checkbox:
-            checkbox.setChecked(bool(text.strip()))  # Set the checkbox status
+        if summaryIndex is not None:
+            self.summary.setFlag(summaryIndex, bool(value))  # Set the summary status
 
 
     def loadInformation(self):
         """
         Loads existing texture information into the UI. Fills text fields with saved texture values 
-        and updates checkboxes based on existing data.
+        and updates the summary based on existing data.
         """
+        # Signals are blocked while filling the fields, the texture already holds these values
+        self.nameTXT.blockSignals(True)
         self.nameTXT.setText(self.texture.name)
-        # Dynamically load information for each texture row
-        for row, (attr, details) in zip(self.textureRows, self.texture.textureMapping.items()):
+        self.nameTXT.blockSignals(False)
+        # The summary is set from the texture directly, texture rows may not be built yet
+        self.summary.setFlags(sum(1 << index for index, attr in enumerate(self.textureAttrs) if getattr(self.texture, attr)))
+
+        for row, attr in zip(self.textureRows, self.textureAttrs):
             # Check if the attribute exists in the texture and load its value
             value = getattr(self.texture, attr, "")
             #print(f"type: {attr} value: {value}")
-            row.txt.setText(value)
+            row.txt.blockSignals(True)
+            row.txt.setText(value or "")
+            row.txt.blockSignals(False)
+
+    def rebind(self, texture, mainPath=None):
+        """
+        Shows another texture in this widget, so the widgets of a cleared list are reused instead of built again.
+
+        Every Texture class shares the same texture mapping, so the summary and texture rows already match the new texture.
+
+        Args:
+            texture (Texture): The texture object containing material properties.
+            mainPath (str, optional): The main directory path where texture files are stored. Defaults to None.
+        """
+        for timer in self._pendingTimers.values():
+            timer.stop()  # Pending edits belonged to the previous texture
+        self.texture = texture
+        self.mainPath = mainPath
+        for row in self.textureRows:
+            row.mainPath = mainPath
+        if self.visibility:
+            self.toggleVisibility()  # Start collapsed, like a new widget
+        self.loadInformation()
         
 #endregion
             
 #region Main
+# Houdini variables resolved by verifyFolderPath when a folder path starts with them
+_FOLDER_VARIABLES = frozenset(("$HOME", "$HIP", "$JOB"))
 
 def getHoudiniMainWindow():
     """
@@ -603,6 +838,52 @@ def getHoudiniMainWindow():
     """
     return hou.qt.mainWindow()
 
+class ktTextureScanSignals(QtCore.QObject):
+    """Signals of a ktTextureScanWorker, a QRunnable is not a QObject and can't emit them itself."""
+    finished = QtCore.Signal(int, object, str)  # Scan generation, textures found, error message
+
+class ktTextureScanWorker(QtCore.QRunnable):
+    def __init__(self, generation, scanFunction, *args):
+        """
+        Runs a folder scan outside the Houdini UI thread and reports the textures found.
+
+        Args:
+            generation (int): The scan generation, used by the dialog to ignore outdated results.
+            scanFunction (callable): The function that scans the folder, it must not touch the UI.
+            *args: The arguments passed to scanFunction.
+        """
+        super(ktTextureScanWorker, self).__init__()
+        self.generation = generation
+        self.scanFunction = scanFunction
+        self.args = args
+        self.cancelled = False
+        self.signals = ktTextureScanSignals()
+
+    def cancel(self):
+        """Asks the scan to stop, it is checked before every folder is read."""
+        self.cancelled = True
+
+    def isCancelled(self):
+        """
+        Returns:
+            bool: True if a newer scan replaced this one.
+        """
+        return self.cancelled
+
+    def run(self):
+        """Scans the folder and emits the result, errors are sent back instead of being shown from this thread."""
+        try:
+            textures = self.scanFunction(*self.args, isCancelled=self.isCancelled)
+            error = ""
+        except OSError as e:
+            textures = {}
+            error = f"Error reading directory: {e}"
+        except Exception as e:
+            # Any other failure is reported as well, the dialog is always told the scan is over
+            textures = {}
+            error = f"Error scanning textures: {e}"
+        self.signals.finished.emit(self.generation, textures, error)
+
 class ktTextureImporter(QtWidgets.QDialog):
     """
     A Houdini Qt dialog for importing textures based on predefined patterns.
@@ -614,7 +895,18 @@ class ktTextureImporter(QtWidgets.QDialog):
         texList (list): A list of texture widgets displayed in the UI.
         mainLayout (QVBoxLayout): The main layout containing all widgets.
     """
-    def __init__(self, parent=getHoudiniMainWindow()):
+    # Number of entries kept by the texture and created material caches, they are emptied once full
+    _MATERIAL_CACHE_SIZE = 512
+    # Number of user patterns kept by the pattern cache, it is emptied once full
+    _PATTERN_CACHE_SIZE = 32
+    # Delay in milliseconds used to debounce pattern edits before scanning the folder again
+    _PATTERN_DELAY = 250
+    # Number of texture widgets built at once, the next ones are built when the list is scrolled to the bottom
+    _TEXTURE_PAGE_SIZE = 40
+    # Number of texture widgets kept when the list is cleared, enough to build the next first page without creating any
+    _WIDGET_POOL_SIZE = _TEXTURE_PAGE_SIZE
+
+    def __init__(self, parent=None):
         """
         Initializes the ktTextureImporter dialog.
 
@@ -624,13 +916,40 @@ class ktTextureImporter(QtWidgets.QDialog):
         Args:
             parent (QWidget, optional): The parent widget, defaulting to the Houdini main window.
         """
+        if parent is None:
+            parent = getHoudiniMainWindow()  # Read when the dialog is built, not when the module is loaded
         super(ktTextureImporter, self).__init__(parent)
         
         self.setWindowTitle('kt_TextureImporter')
+        self.setObjectName('ktTextureImporter')  # Found again by showTextureImporter
         self.setMinimumWidth(600)
         self.setMinimumHeight(700)
         self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint)
         
+        self.texList = []
+        self._pendingTextures = []  # Textures found by the last scan that don't have a widget yet
+        self._widgetPool = []  # Hidden texture widgets of a cleared list, reused by buildTexturePage
+        self._compiledPattern = None
+        self._patternLiterals = ()
+        self._patternCache = {}  # (compiled regex, literals) of every user pattern loaded, the regex is None when it can't be compiled
+        self._imageNodeCache = {}
+        self._materialCache = {}  # Textures already built, keyed by (texture class, signature), reused when the same folder is imported again
+        self._createdMaterials = {}  # Paths of the materials already created, keyed by (texture class, folder, signature, image format, parent path)
+
+        # Folder scans run one at a time in their own pool, each new scan makes the previous one outdated
+        self._scanPool = QtCore.QThreadPool(self)
+        self._scanPool.setMaxThreadCount(1)
+        self._scanWorker = None
+        self._scanGeneration = 0
+        self._scanFolderPath = ""
+        self._scanTextureClass = None
+        self._scanKey = None
+        self._lastScan = (None, {})  # (scan key, textures) of the last successful scan, reused when only the texture type changes
+
+        # Pattern edits restart this timer, the folder is only scanned once the user stops typing
+        self._patternTimer = QtCore.QTimer(self)
+        self._patternTimer.setSingleShot(True)
+        self._patternTimer.setInterval(self._PATTERN_DELAY)
         
         self.createWidgets()
         self.createLayouts()
@@ -730,18 +1049,13 @@ class ktTextureImporter(QtWidgets.QDialog):
 
         """ TEXTURES CONTAINER """
         self.texScroll = QtWidgets.QScrollArea()             # Scroll Area which contains the widgets, set as the centralWidget
-        self.texContainer = QtWidgets.QWidget()                 # Widget that contains the collection of Vertical Box
-        self.texLYT = QtWidgets.QVBoxLayout()               # The Vertical Box that contains the Horizontal Boxes of  labels and buttons
-        self.texLYT.setContentsMargins(0, 0, 0, 0)
-        self.texLYT.setSpacing(0)
-
-        self.texContainer.setLayout(self.texLYT)
 
         #Scroll Area Properties
         self.texScroll.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
         self.texScroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.texScroll.setWidgetResizable(True)
-        self.texScroll.setWidget(self.texContainer)
+        self.createTextureContainer()
+        self.texScrollBar = self.texScroll.verticalScrollBar()
 
         """ MAIN """
         self.mainLayout.addLayout(self.textureTypeLYT)
@@ -754,12 +1068,18 @@ class ktTextureImporter(QtWidgets.QDialog):
     def createConnections(self):
         """Function that creates all the connections"""
         self.folderPathBTN.fileSelected.connect(self.onClick_folderPathBTN)
+        self.folderPathTXT.textChanged.connect(self.onChange_folderPathTXT)
         self.matPathBTN.nodeSelected.connect(self.onClick_matPathBTN)
         self.clearBTN.clicked.connect(self.onClick_clearBTN)
         self.selectAllCB.clicked.connect(self.onChange_selectAllCB)
         self.createBTN.clicked.connect(self.onClick_createBTN)
         self.textureTypeCMB.currentIndexChanged.connect(self.onChange_textureTypeCMB)
+        # Only restarts the pattern timer, the pattern is compiled by loadTextures once the user stops typing
         self.patternCMB.lineEdit().textChanged.connect(self.onChange_Finished_patternCMB)
+        self._patternTimer.timeout.connect(self._loadPatternTextures)
+        # Build more texture widgets when the list reaches the bottom or still fits without scrolling
+        self.texScrollBar.valueChanged.connect(self.onChange_texScrollBar)
+        self.texScrollBar.rangeChanged.connect(self.onChange_texScrollBar)
     
     def showMessageError(self, message):
         """
@@ -774,18 +1094,32 @@ class ktTextureImporter(QtWidgets.QDialog):
         msg.setWindowTitle("Houdini Error")
         msg.exec_()
 
+    @QtCore.Slot()
     def onClick_clearBTN(self):
         """
         Clears all selected textures and resets input fields.
 
         Resets the folder path and material library path while disabling 
-        the "Create" button.
+        the "Create" button. A scan still running is ignored once it finishes.
         """
-        self.clearLayout(self.texLYT)
+        self.cancelScan()
+        self.clearTextureList()
         self.folderPathTXT.setText("")
         self.matPathTXT.setText("")
         self.createBTN.setEnabled(False)
     
+    @QtCore.Slot(str)
+    def onChange_folderPathTXT(self, text):
+        """
+        Ignores any pending scan once the folder path is emptied, its textures no longer have a folder.
+
+        Args:
+            text (str): The new folder path.
+        """
+        if not text:
+            self.cancelScan()
+
+    @QtCore.Slot(str)
     def onClick_folderPathBTN(self, filePath):
         """
         Handles folder selection and triggers texture loading.
@@ -797,6 +1131,7 @@ class ktTextureImporter(QtWidgets.QDialog):
             self.folderPathTXT.setText(filePath)
             self.loadTextures()
     
+    @QtCore.Slot(object)
     def onClick_matPathBTN(self, node):
         """
         Validates and sets the selected Material Library node.
@@ -814,41 +1149,59 @@ class ktTextureImporter(QtWidgets.QDialog):
                 self.matPathTXT.clear()
                 self.showMessageError("The node selected is not a Material Library, please check")
     
+    @QtCore.Slot()
     def onClick_createBTN(self):
         """
         Creates textures inside the selected Material Library.
 
         Uses the imported texture data to generate texture nodes inside 
-        the specified Houdini Material Library.
+        the specified Houdini Material Library. Materials already created from
+        the same texture data in this Material Library are skipped.
         """
         parentNode = hou.node(self.matPathTXT.text())
         
         if parentNode:
             folderPath = self.folderPathTXT.text()
+            resolvedFolderPath = self.verifyFolderPath(folderPath)  # Signatures only hold relative filenames
             imageFormat = self.imageFormatCMB.currentText()
-            for tex in self.texList:
-                #tex = ktTextureWidget() # type: ktTextureWidget
-                if tex.selectedCB.isChecked():
-                    tex.texture.createTexture(parentNode,folderPath, imageFormat)
-
-            parentNode.layoutChildren()
+            self._imageNodeCache.clear()  # Nodes from a previous run may have been deleted since
+            selectedTextures = [tex.texture for tex in self.texList if tex.selectedCB.isChecked()]
+            if self.selectAllCB.isChecked():
+                selectedTextures.extend(self._pendingTextures)  # Not scrolled to yet, but selected by Select All
+
+            # Every material of the batch goes to a single undo entry, each createTexture group nests inside it
+            with hou.undos.group("Create Textures"):
+                for texture in selectedTextures:
+                    key = (type(texture), resolvedFolderPath, texture.getSignature(), imageFormat, parentNode.path())
+                    materialPath = self._createdMaterials.get(key)
+                    if materialPath and hou.node(materialPath):
+                        continue
+
+                    materialNode = texture.createTexture(parentNode,folderPath, imageFormat, cache=self._imageNodeCache)
+                    if len(self._createdMaterials) >= self._MATERIAL_CACHE_SIZE:
+                        self._createdMaterials.clear()  # Keep the cache bounded for long sessions
+                    self._createdMaterials[key] = materialNode.path()
+
+                parentNode.layoutChildren()
         else:
             self.showMessageError("A material Library needs to be selected")
     
+    @QtCore.Slot()
     def onChange_selectAllCB(self):
         """
         Toggles the selection state of all texture checkboxes.
 
-        If checked, all textures in the list are selected for import.
+        If checked, all textures in the list are selected for import, otherwise they are all deselected.
         """
-        if self.selectAllCB.isChecked():
-            self.checkAllTextures()
+        self.checkAllTextures()
     
+    @QtCore.Slot()
     def onChange_textureTypeCMB(self):
         """
         Reloads textures when the texture type selection changes.
 
         This function ensures the displayed textures match the selected type.
+        The files found by the last scan are wrapped in the new type without scanning the folder again.
         """
         if self.textureTypeCMB.currentText() == 'Karma':
             self.imageFormatCMB.setVisible(True)
@@ -856,141 +1209,333 @@ class ktTextureImporter(QtWidgets.QDialog):
             self.imageFormatCMB.setVisible(False)
 
         if self.folderPathTXT.text():
-            self.loadTextures()
+            self.loadTextures(rescan=False)
     
+    @QtCore.Slot()
     def onChange_Finished_patternCMB(self):
         """
         Reloads textures when the filename pattern is modified.
 
-        Updates the texture list to reflect the new filename-matching pattern.
+        The reload is debounced, every edit restarts the pattern timer and
+        `_loadPatternTextures` runs once the user stops typing.
         """
+        self._patternTimer.start()
+
+    @QtCore.Slot()
+    def _loadPatternTextures(self):
+        """Updates the texture list to reflect the new filename-matching pattern."""
         if self.folderPathTXT.text():
             self.loadTextures()
             
 
-    def loadTextures(self):
+    def _recompilePattern(self, userPattern):
+        """
+        Compiles the user pattern once so every folder scan reuses the same regex object.
+        Patterns typed before are taken from the pattern cache instead of being built again.
+
+        Args:
+            userPattern (str): The user-defined pattern containing placeholders.
+        """
+        if userPattern in self._patternCache:
+            self._compiledPattern, self._patternLiterals = self._patternCache[userPattern]
+            return
+
+        try:
+            self._compiledPattern = re.compile(self.getRegexPattern(userPattern), re.IGNORECASE)
+        except re.error:
+            # Patterns such as a repeated placeholder can't be compiled, they simply match nothing
+            self._compiledPattern = None
+        self._patternLiterals = self.getPatternLiterals(userPattern)
+
+        if len(self._patternCache) >= self._PATTERN_CACHE_SIZE:
+            self._patternCache.clear()  # Every pattern loaded adds an entry, keep the cache small
+        self._patternCache[userPattern] = (self._compiledPattern, self._patternLiterals)
+
+    def cancelScan(self):
+        """
+        Makes any pending folder scan outdated, so its result is ignored by `_populateTextureList`.
+        """
+        self._scanGeneration += 1
+        if self._scanWorker:
+            self._scanWorker.cancel()
+            self._scanPool.clear()  # Drop the scan if it didn't start yet
+            self._scanWorker = None
+
+    def loadTextures(self, rescan=True):
         """
         Loads textures from the selected folder based on the current pattern.
 
-        Uses regex matching to filter textures and displays matching results 
-        in the UI.
+        The folder is scanned by a ktTextureScanWorker so Houdini stays responsive,
+        any scan still pending is cancelled and its results are ignored.
+
+        Args:
+            rescan (bool, optional): Scan the folder even if the last scan used the same folder, pattern and mapping.
+                Defaults to True.
         """
-        self.clearLayout(self.texLYT)
-        self.texList = []
+        self._patternTimer.stop()  # This load already uses the latest pattern
+        self._recompilePattern(self.patternCMB.currentText())  # Taken from the pattern cache when it didn't change
+        self.cancelScan()
 
         folderPath = self.folderPathTXT.text()
-        filePattern = self.patternCMB.currentText()
-        regexPattern = self.getRegexPattern(filePattern)
-        textureType = self.textureTypeCMB.currentText() + "Texture"
-        textureClass = globals().get(textureType)
-
-        textures = self.readTexturesFromFolder(folderPath, regexPattern, textureClass)
-
-        if textures:
-            self.createBTN.setEnabled(True)
-            # Display texture information
-            for texture in textures.values():
-                #texture = Texture() # type: Texture
-                #texture.showInformation()
-                attributes = {key: value for key, value in vars(texture).items() if key != "textureMapping"}
-                newTexture = textureClass(**attributes)
-
-                textureWD = ktTextureWidget(texture=newTexture, mainPath=folderPath)
-                self.texLYT.addWidget(textureWD)
+        regexPattern = self._compiledPattern
+        self._scanFolderPath = folderPath
+        self._scanTextureClass = _TEXTURE_CLASSES.get(self.textureTypeCMB.currentText())
+
+        if not regexPattern:
+            self._scanKey = None
+            self._populateTextureList(self._scanGeneration, {}, "")
+            return
+
+        # Houdini variables are resolved here, the worker only reads the file system
+        resolvedPath = self.verifyFolderPath(folderPath)
+
+        # Texture types sharing the same mapping find the same files, only their Texture class differs
+        self._scanKey = (resolvedPath, regexPattern.pattern, id(self._scanTextureClass._LOOKUP))
+        scanKey, textures = self._lastScan
+        if not rescan and scanKey == self._scanKey:
+            self._populateTextureList(self._scanGeneration, textures, "")
+            return
+
+        worker = ktTextureScanWorker(self._scanGeneration, self.readTexturesFromFolder, resolvedPath,
+                                     regexPattern, self._scanTextureClass, self._patternLiterals)
+        worker.signals.finished.connect(self._populateTextureList)
+        self._scanWorker = worker
+        self._scanPool.start(worker)
+
+    @QtCore.Slot(int, object, str)
+    def _populateTextureList(self, generation, textures, error):
+        """
+        Displays the textures found by a folder scan, results of outdated scans are ignored.
+
+        Args:
+            generation (int): The generation of the scan that finished.
+            textures (dict): The attributes of every texture found, mapped by texture names.
+            error (str): The error message of the scan, empty if it succeeded.
+        """
+        if generation != self._scanGeneration:
+            return
+        self._scanWorker = None
+
+        if error:
+            self.showMessageError(error)
+        elif self._scanKey is not None:
+            self._lastScan = (self._scanKey, textures)
+
+        self.clearTextureList()
+
+        # Repaint the container once all the widgets are in place instead of after every one of them
+        self.texContainer.setUpdatesEnabled(False)
+        try:
+            textureClass = self._scanTextureClass
+
+            if textures:
+                self.createBTN.setEnabled(True)
+                # Display texture information
+                for attributes in textures.values():
+                    #texture = Texture() # type: Texture
+                    #texture.showInformation()
+                    signature = tuple(attributes.get(attr) for attr in Texture.__slots__)  # Same values as getSignature
+                    newTexture = self._materialCache.get((textureClass, signature))
+
+                    # Texture objects are only built when the cache can't be used, cached textures edited through the UI no longer describe this material
+                    if newTexture is None or newTexture.getSignature() != signature:
+                        newTexture = textureClass(**attributes)
+                        if len(self._materialCache) >= self._MATERIAL_CACHE_SIZE:
+                            self._materialCache.clear()  # Keep the cache bounded for long sessions
+                        self._materialCache[(textureClass, signature)] = newTexture
+                    self._pendingTextures.append(newTexture)
+
+                self.texLYT.addStretch()
+                self.buildTexturePage()
+            else:
+                self.createBTN.setEnabled(False)
+                # Show a message on the screen saying there's no results
+                lbl = QtWidgets.QLabel("No results. Verify Pattern")
+                lbl.setAlignment(QtCore.Qt.AlignCenter)
+                lbl.setStyleSheet("background-color: #995D58; color: white; padding: 10px; font-weight: bold;")
+                self.texLYT.addWidget(lbl)
+        finally:
+            self.texContainer.setUpdatesEnabled(True)
+
+    def buildTexturePage(self):
+        """
+        Builds the widgets of the next page of pending textures, keeping the list stretch at the end.
+
+        Widgets kept by clearTextureList are reused before new ones are built.
+        Widgets built after "Select All" was checked start selected as well.
+        """
+        page = self._pendingTextures[:self._TEXTURE_PAGE_SIZE]
+        del self._pendingTextures[:self._TEXTURE_PAGE_SIZE]
+
+        selectAll = self.selectAllCB.isChecked()
+        self.texContainer.setUpdatesEnabled(False)
+        try:
+            for texture in page:
+                if self._widgetPool:
+                    textureWD = self._widgetPool.pop()
+                    textureWD.rebind(texture, mainPath=self._scanFolderPath)
+                else:
+                    textureWD = ktTextureWidget(texture=texture, mainPath=self._scanFolderPath)
+                textureWD.selectedCB.setChecked(selectAll)
+                self.texLYT.insertWidget(self.texLYT.count() - 1, textureWD)  # Before the stretch
+                textureWD.show()  # Pooled widgets were hidden by clearTextureList
                 self.texList.append(textureWD)
+        finally:
+            self.texContainer.setUpdatesEnabled(True)
 
-            self.texLYT.addStretch()
-        else:
-            self.createBTN.setEnabled(False)
-            # Show a message on the screen saying there's no results
-            lbl = QtWidgets.QLabel("No results. Verify Pattern")
-            lbl.setAlignment(QtCore.Qt.AlignCenter)
-            lbl.setStyleSheet("background-color: #995D58; color: white; padding: 10px; font-weight: bold;")
-            self.texLYT.addWidget(lbl)
+    @QtCore.Slot(int)
+    @QtCore.Slot(int, int)
+    def onChange_texScrollBar(self, *args):
+        """
+        Builds the next page of texture widgets once the list is scrolled near its bottom.
+
+        Args:
+            *args: Values sent by the valueChanged or rangeChanged signals, the scroll bar is read directly.
+        """
+        if self._pendingTextures and self.texScrollBar.value() >= self.texScrollBar.maximum() - self.texScrollBar.pageStep():
+            self.buildTexturePage()
 
-    def readTexturesFromFolder(self, folderPath, regexPattern, textureClass=Texture):
+    def readTexturesFromFolder(self, folderPath, regexPattern, textureClass=Texture, literals=(), isCancelled=None):
         """
         Reads and organizes textures from a specified folder.
 
         Iterates through files in the given directory, applies regex matching 
         to extract texture information, and maps them to texture attributes.
+        Hidden and system sub folders (see _SKIPPED_FOLDERS) are not scanned.
+
+        It doesn't touch the UI or Houdini so it can run in a ktTextureScanWorker.
 
         Args:
-            folderPath (str): The directory containing texture files.
-            regexPattern (str): The regex pattern to match filenames.
-            textureClass (type): The texture class used to instantiate textures.
+            folderPath (str): The directory containing texture files, with Houdini variables already resolved.
+            regexPattern (re.Pattern): The compiled regex pattern to match filenames.
+            textureClass (type): The texture class whose mapping resolves the texture types.
+            literals (tuple, optional): (lowercase fixed part, occurrences) pairs of the pattern, files containing any part
+                fewer times than the pattern does skip the regex. Defaults to ().
+            isCancelled (callable, optional): Returns True when the scan should stop, checked before every folder. Defaults to None.
 
         Returns:
-            dict: A dictionary of texture objects mapped by texture names.
+            dict: The attributes of every texture found ({attr: value}, including its name), mapped by texture names.
+                `Texture` objects are built from them by the dialog, only for the textures it shows.
+                Empty if the folder can't be read, like os.walk.
         """
         textures = {}
-        folderPath = self.verifyFolderPath(folderPath)
-
-        try:
-            # Loop through files in the directory
-            for root, dirs, files in os.walk(folderPath):
-                for filename in files:
-                    if filename.endswith((".exr", ".png", ".jpg")):  # Filter by file type
-                        match = re.match(regexPattern, filename)
-                        if match:
-                            objName = match.group("objName") if "objName" in match.groupdict() else None
-                            texName = match.group("texName")
-                            textureType = match.group("texType")
-                            textureId = match.group("id") if "id" in match.groupdict() else None
-
-                            finalName = f"{objName}_{texName}" if objName else texName
-
-                            # Create texture object if not exists
-                            if finalName not in textures:
-                                textures[finalName] = textureClass(name=finalName) 
-                                #print(f"Created {textures[finalName].__class__.__name__} object: {finalName}")  # Debugging output
-                        
-                            # Replace @id with <UDIM> in the filename if @id is present
-                            if textureId:
-                                filename = filename.replace(textureId, "<UDIM>")
-
-                            textureType = textureType.lower()
-                            textureParent = textures[finalName].getTypeFromAttr("mapping", textureType)
-
-                            # Check if the textureType exists in the mapping dictionary
-                            if textureParent:
-                                relativePath = os.path.relpath(root, folderPath)
-                                relativePath = relativePath.replace("\\", "/")
-
-                                if relativePath != ".":
-                                    finalPath = relativePath + "/" + filename
-                                else:
-                                    finalPath = filename                            
-                                setattr(textures[finalName], textureParent, finalPath)
-        except OSError as e:
-            self.showMessageError(f"Error reading directory: {e}")
+        matchFilename = regexPattern.match  # Bound once, it is called for every file
+
+        # Named groups only depend on the pattern, check them once instead of for every match
+        groupNames = regexPattern.groupindex
+        if "texName" not in groupNames or "texType" not in groupNames:
+            return textures  # Without a texture name and type no file can be mapped
+        hasObjName = "objName" in groupNames
+        hasId = "id" in groupNames
+        typeToAttr = textureClass._LOOKUP["mapping"]  # Same lookup as getTypeFromAttr("mapping", ...), bound once for the scan
+
+        # Walk the folders with os.scandir, its entries already know if they are files or folders without an extra stat
+        # Each folder is stacked with its path relative to folderPath, written with "/" and ready to prefix filenames
+        # Folders are visited depth first, top down, in the same order as os.walk so the same file wins on duplicates
+        pendingFolders = [(folderPath, "")]
+        while pendingFolders:
+            if isCancelled and isCancelled():
+                break  # A newer scan replaced this one, its result won't be used
+            root, relativeFolder = pendingFolders.pop()
+            try:
+                entries = os.scandir(root)
+            except OSError:
+                continue  # Skip unreadable folders the same way os.walk does
+
+            subFolders = []
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folderName = entry.name
+                        if not folderName.startswith(".") and folderName not in _SKIPPED_FOLDERS:
+                            subFolders.append((entry.path, relativeFolder + folderName + "/"))
+                        continue
+
+                    filename = entry.name
+                    lowerName = filename.lower()  # Extensions and fixed parts are compared ignoring case, like the pattern
+                    if not lowerName.endswith(_TEXTURE_EXTENSIONS) or not entry.is_file():  # Filter by file type
+                        continue
+
+                    # Cheap substring count first, a file with fewer fixed parts (like "_") than the pattern can't match
+                    if literals and any(lowerName.count(literal) < count for literal, count in literals):
+                        continue
+
+                    match = matchFilename(filename)
+                    if match:
+                        objName = match.group("objName") if hasObjName else None
+                        texName = match.group("texName")
+                        textureType = match.group("texType")
+                        textureId = match.group("id") if hasId else None
+
+                        finalName = f"{objName}_{texName}" if objName else texName
+
+                        # Create the texture attributes if they don't exist
+                        texture = textures.get(finalName)
+                        if texture is None:
+                            texture = textures[finalName] = {"name": finalName}
+                    
+                        # Replace @id with <UDIM> in the filename if @id is present
+                        if textureId:
+                            filename = filename.replace(textureId, "<UDIM>")
+
+                        textureParent = typeToAttr.get(textureType.lower())
+
+                        # Check if the textureType exists in the mapping dictionary
+                        if textureParent:
+                            texture[textureParent] = relativeFolder + filename
+
+            pendingFolders.extend(reversed(subFolders))  # The first sub folder is scanned next
         
         return textures
 
     def checkAllTextures(self):
         """
         Selects or deselects all texture checkboxes based on the "Select All" state.
+
+        Checkboxes already in that state are left untouched.
         """
-        if self.texList:
-            for textureWD in self.texList:
-                textureWD.selectedCB.setChecked(self.selectAllCB.isChecked())
+        checked = self.selectAllCB.isChecked()
+        for textureWD in self.texList:
+            selectedCB = textureWD.selectedCB
+            if selectedCB.isChecked() != checked:
+                selectedCB.setChecked(checked)
 
-    def clearLayout(self, layout):
+    def createTextureContainer(self):
         """
-        Clears all widgets and items from a given layout.
+        Creates an empty texture container and sets it in the scroll area.
 
-        Args:
-            layout (QLayout): The layout to be cleared.
+        The previous container, with every widget inside it, is removed in a single
+        step and deleted once control returns to the event loop.
+        """
+        oldContainer = self.texScroll.takeWidget()
+
+        self.texContainer = QtWidgets.QWidget()                 # Widget that contains the collection of Vertical Box
+        self.texLYT = QtWidgets.QVBoxLayout()               # The Vertical Box that contains the Horizontal Boxes of  labels and buttons
+        self.texLYT.setContentsMargins(0, 0, 0, 0)
+        self.texLYT.setSpacing(0)
+
+        self.texContainer.setLayout(self.texLYT)
+        self.texContainer.setStyleSheet(_TEXTURE_WIDGET_STYLE)  # Shared by every ktTextureWidget added to the container
+        self.texScroll.setWidget(self.texContainer)
+
+        if oldContainer:
+            oldContainer.deleteLater()
+
+    def clearTextureList(self):
+        """
+        Clears every texture widget and pending texture, and resets the "Select All" checkbox.
+
+        Up to `_WIDGET_POOL_SIZE` widgets are hidden and kept for the next list instead of being deleted.
         """
         self.selectAllCB.setChecked(False)
-        for i in reversed(range(layout.count())):
-            item = layout.itemAt(i)
-            if item.widget(): 
-                widgetToRemove = item.widget()
-                layout.removeWidget(widgetToRemove)
-                widgetToRemove.setParent(None)
-            else: 
-                layout.removeItem(item)
+        self.texContainer.setUpdatesEnabled(False)  # The container is replaced below, don't relayout it for every widget taken out
+        for textureWD in self.texList[:self._WIDGET_POOL_SIZE - len(self._widgetPool)]:
+            textureWD.hide()
+            textureWD.setParent(self)
+            self._widgetPool.append(textureWD)
+        self.texList = []
+        self._pendingTextures = []
+        self.createTextureContainer()
         
 
     def getRegexPattern(self, userPattern):
@@ -1011,7 +1556,7 @@ class ktTextureImporter(QtWidgets.QDialog):
         # Replace placeholders with named capturing groups
         regexPattern = regexPattern.replace("@objName", r"(?P<objName>[^_]+)?")
         regexPattern = regexPattern.replace("@texName", r"(?P<texName>[^_]+)")
-        regexPattern = regexPattern.replace("@texType", r"(?P<texType>[^_]+)")
+        regexPattern = regexPattern.replace("@texType", f"(?P<texType>{Texture._MAPPING_REGEX.pattern})")  # Only known texture types
         regexPattern = regexPattern.replace("@id", r"(?P<id>\d+)?")  # Capture @id as a number
 
         # Adjust for file extension dynamically
@@ -1021,6 +1566,24 @@ class ktTextureImporter(QtWidgets.QDialog):
         #print(f"Generated Regex Pattern: {regexPattern}")
         return regexPattern
 
+    def getPatternLiterals(self, userPattern):
+        """
+        Extracts the fixed parts of a user-defined pattern, the text found between its placeholders.
+
+        Args:
+            userPattern (str): The user-defined pattern containing placeholders.
+
+        Returns:
+            tuple: (lowercase fixed part, occurrences) pairs, a matching filename contains every part at least that many times.
+        """
+        literals = re.split(r"@objName|@texName|@texType|@id|\*|(?<=\.)ext", userPattern)
+        counts = {}
+        for literal in literals:
+            if literal:
+                literal = literal.lower()
+                counts[literal] = counts.get(literal, 0) + 1
+        return tuple(counts.items())
+
     def verifyFolderPath(self, folderPath):
         """
         Resolves environment variable prefixes in a folder path.
@@ -1035,34 +1598,43 @@ class ktTextureImporter(QtWidgets.QDialog):
         Returns:
             str: The resolved absolute folder path.
         """
-        pathRoot = folderPath.partition("/")[0]
-        pathOriginal = folderPath.partition("/")[2]
+        pathRoot, _, pathOriginal = folderPath.partition("/")
 
-        finalPath = None
-        prefix = None
+        if pathRoot in _FOLDER_VARIABLES:
+            prefix = hou.getenv(pathRoot[1:])
+            if prefix:
+                return prefix + "/" + pathOriginal
 
-        if pathRoot == "$HOME":
-            prefix=str(hou.getenv("HOME"))
-        elif pathRoot == "$HIP":
-            prefix=str(hou.getenv("HIP"))
-        elif pathRoot == "$JOB":
-            prefix=str(hou.getenv("JOB"))
+        return folderPath
 
-        if prefix:
-            finalPath = prefix + "/" + pathOriginal
-        else:
-            finalPath = folderPath
 
-        return finalPath
+def showTextureImporter():
+    """
+    Shows the texture importer, reusing the dialog already parented to the Houdini main window.
 
+    The dialog is only built the first time, running the tool again brings the same dialog back
+    with its folder, pattern and textures instead of building every widget again. Dialogs built
+    by an older version of this module (after it was edited and run again) are closed and replaced.
 
-#endregion
+    Returns:
+        ktTextureImporter: The dialog shown.
+    """
+    for dialog in getHoudiniMainWindow().findChildren(QtWidgets.QDialog, 'ktTextureImporter'):
+        if type(dialog) is ktTextureImporter:
+            dialog.show()
+            dialog.raise_()
+            dialog.activateWindow()
+            return dialog
 
-try:
-    ktTextureImporter.close()
-    ktTextureImporter.deleteLater()
-except:
-    pass
+        dialog.close()
+        dialog.setObjectName("")  # Not found again while it waits to be deleted
+        dialog.deleteLater()
+
+    dialog = ktTextureImporter()
+    dialog.show()
+    return dialog
+
+#endregion
 
-ktTextureImporter = ktTextureImporter()
-ktTextureImporter.show()
+# Kept under its own name, rebinding ktTextureImporter would hide the class from later showTextureImporter calls
+ktTextureImporterDialog = showTextureImporter()